@@ -0,0 +1,35 @@
+"""Add functional index on lower(email)
+
+Revision ID: 53a414fe13b4
+Revises: de4e0f6fc793
+Create Date: 2026-08-28 08:22:41.118905
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "53a414fe13b4"
+down_revision: Union[str, Sequence[str], None] = "de4e0f6fc793"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # fastapi-users looks users up by lower(email); the existing unique
+    # index on email can't serve that predicate.
+    op.create_index(
+        "ix_user_email_lower",
+        "user",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_email_lower", table_name="user")
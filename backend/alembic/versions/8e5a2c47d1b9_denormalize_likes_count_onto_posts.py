@@ -0,0 +1,60 @@
+"""Denormalize likes_count onto posts
+
+Revision ID: 8e5a2c47d1b9
+Revises: c91d03f57ae2
+Create Date: 2026-08-28 09:14:55.631407
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e5a2c47d1b9"
+down_revision: Union[str, Sequence[str], None] = "c91d03f57ae2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts",
+        sa.Column("likes_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Backfill from the source of truth before the triggers take over.
+    op.execute(
+        "UPDATE posts SET likes_count = "
+        "(SELECT count(*) FROM likes WHERE post_id = posts.id)"
+    )
+    # Triggers keep the counter exact on every like/unlike, so the feed
+    # never has to aggregate the likes table again.
+    op.execute(
+        """
+        CREATE FUNCTION likes_count_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE posts SET likes_count = likes_count + 1
+                WHERE id = NEW.post_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE posts SET likes_count = likes_count - 1
+                WHERE id = OLD.post_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_likes_count AFTER INSERT OR DELETE ON likes "
+        "FOR EACH ROW EXECUTE FUNCTION likes_count_sync()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER trg_likes_count ON likes")
+    op.execute("DROP FUNCTION likes_count_sync()")
+    op.drop_column("posts", "likes_count")
@@ -0,0 +1,34 @@
+"""Add composite index for keyset pagination on posts
+
+Revision ID: b6d92a4e81c5
+Revises: f7c31be29a04
+Create Date: 2026-08-28 08:41:37.902516
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d92a4e81c5"
+down_revision: Union[str, Sequence[str], None] = "f7c31be29a04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The feed's keyset paginator seeks on (created_at, id) DESC; this
+    # index turns every page into an index scan from the cursor position.
+    op.create_index(
+        "ix_posts_created_id",
+        "posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_created_id", table_name="posts")
@@ -0,0 +1,37 @@
+"""Add trigram indexes for post search
+
+Revision ID: c91d03f57ae2
+Revises: b6d92a4e81c5
+Create Date: 2026-08-28 08:58:03.117264
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c91d03f57ae2"
+down_revision: Union[str, Sequence[str], None] = "b6d92a4e81c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The feed search runs ILIKE '%term%' on title/content, which a B-tree
+    # can never serve — every search was a sequential scan. pg_trgm GIN
+    # indexes turn it into an index scan; the planner picks them up for
+    # the existing ilike filters with no query changes.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_posts_title_trgm ON posts USING GIN (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_posts_content_trgm ON posts USING GIN (content gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_content_trgm", table_name="posts")
+    op.drop_index("ix_posts_title_trgm", table_name="posts")
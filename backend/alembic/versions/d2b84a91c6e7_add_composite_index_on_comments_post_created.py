@@ -0,0 +1,30 @@
+"""Add composite index on comments(post_id, created_at)
+
+Revision ID: d2b84a91c6e7
+Revises: 8e5a2c47d1b9
+Create Date: 2026-08-28 09:47:28.315672
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b84a91c6e7"
+down_revision: Union[str, Sequence[str], None] = "8e5a2c47d1b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Comment pages run WHERE post_id=? ORDER BY created_at with a keyset
+    # seek; this index makes each page a bounded range scan, no sort.
+    op.create_index(
+        "ix_comment_post_created", "comments", ["post_id", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_comment_post_created", table_name="comments")
@@ -0,0 +1,44 @@
+"""Cascade delete comments with post
+
+Revision ID: de4e0f6fc793
+Revises: ec21acc1d2df
+Create Date: 2026-08-28 08:15:12.334821
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "de4e0f6fc793"
+down_revision: Union[str, Sequence[str], None] = "ec21acc1d2df"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Let the database cascade comment deletion when a post is deleted,
+    # so posts can be removed with a single DELETE statement instead of
+    # loading the post and its comments into the ORM first.
+    op.drop_constraint("comments_post_id_fkey", "comments", type_="foreignkey")
+    op.create_foreign_key(
+        "comments_post_id_fkey",
+        "comments",
+        "posts",
+        ["post_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("comments_post_id_fkey", "comments", type_="foreignkey")
+    op.create_foreign_key(
+        "comments_post_id_fkey",
+        "comments",
+        "posts",
+        ["post_id"],
+        ["id"],
+    )
@@ -0,0 +1,29 @@
+"""Add covering index on likes(post_id, user_id)
+
+Revision ID: f7c31be29a04
+Revises: 53a414fe13b4
+Create Date: 2026-08-28 08:30:12.448122
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7c31be29a04"
+down_revision: Union[str, Sequence[str], None] = "53a414fe13b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The composite PK leads with user_id, so the feed's group-by-post and
+    # the like-existence checks (post_id first) can't use it. This index
+    # makes both index-only scans.
+    op.create_index("ix_likes_post_user", "likes", ["post_id", "user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_likes_post_user", table_name="likes")
@@ -1,31 +1,86 @@
+import hashlib
 import uuid
-from fastapi_users import FastAPIUsers
+
+import jwt
+from cachetools import TTLCache
+from fastapi import Depends
+from fastapi.security import OAuth2PasswordBearer
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
     CookieTransport,
     JWTStrategy,
 )
-from .models import User
+
+from fastapi_users import FastAPIUsers
+
 from .config import get_settings
 from .manager import get_user_manager  # <-- Import from new file
+from .models import User
 
-# --- 2. JWT Strategies ---
+# Settings bound ONCE at import — three get_settings() calls collapsed
+settings = get_settings()
 
+# --- 1. Token Verification Cache ---
+# Every request with a token pays a full HS256 verify + a DB user lookup.
+# Cache the resolved user for a short window so bursty clients skip both.
+# Keyed by sha256(token) so we never hold raw tokens in memory.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
 
-# Short-lived ACCESS token (15 minutes)
-def get_access_token_strategy() -> JWTStrategy:
-    return JWTStrategy(
-        secret=get_settings().JWT_SECRET,
-        lifetime_seconds=900,  # 15 minutes
-    )
 
+def _cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def invalidate_cached_token(token: str) -> None:
+    """Drop a token from the verification cache (e.g. on refresh rotation)."""
+    _token_cache.pop(_cache_key(token), None)
+
+
+class CachingJWTStrategy(JWTStrategy):
+    """
+    JWTStrategy that caches successful read_token results for a short TTL,
+    skipping the JWT decode and the SQLAlchemy user fetch on repeat hits.
+    """
+
+    async def read_token(self, token, user_manager):
+        if token is None:
+            return None
+
+        key = _cache_key(token)
+        user = _token_cache.get(key)
+        if user is not None:
+            return user
+
+        user = await super().read_token(token, user_manager)
+        if user is not None:
+            _token_cache[key] = user
+        return user
+
+
+# --- 2. JWT Strategies ---
+# Built ONCE at import time. The old per-call constructors allocated a
+# fresh strategy object (and HMAC context) for every token sign/verify.
+
+# Short-lived ACCESS token (15 minutes)
+_access_token_strategy = CachingJWTStrategy(
+    secret=settings.JWT_SECRET,
+    lifetime_seconds=900,  # 15 minutes
+)
 
 # Long-lived REFRESH token (7 days)
-def get_refresh_token_strategy() -> JWTStrategy:
-    return JWTStrategy(
-        secret=get_settings().JWT_SECRET, lifetime_seconds=604800  # 7 days
-    )
+_refresh_token_strategy = CachingJWTStrategy(
+    secret=settings.JWT_SECRET,
+    lifetime_seconds=604800,  # 7 days
+)
+
+
+def get_access_token_strategy() -> CachingJWTStrategy:
+    return _access_token_strategy
+
+
+def get_refresh_token_strategy() -> CachingJWTStrategy:
+    return _refresh_token_strategy
 
 
 # --- 3. Transports ---
@@ -38,7 +93,7 @@ cookie_transport = CookieTransport(
     cookie_name="refresh_token",
     cookie_max_age=604800,
     cookie_httponly=True,
-    cookie_secure=get_settings().ENVIRONMENT == "production",
+    cookie_secure=settings.ENVIRONMENT == "production",
     cookie_samesite="lax",
 )
 
@@ -70,3 +125,27 @@ current_active_user = fastapi_users.current_user(active=True)
 # --- 7. ADD THIS NEW DEPENDENCY ---
 # Dependency for a user who is logged in AND verified
 current_active_verified_user = fastapi_users.current_user(active=True, verified=True)
+
+
+# --- 8. Lightweight Optional Viewer ---
+# Public reads only need the viewer's id for the user_has_liked filter,
+# so decode the JWT locally and trust its sub — no DB round-trip.
+# Anonymous or invalid tokens simply yield None.
+_optional_bearer = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+
+async def optional_viewer_id(
+    token: str | None = Depends(_optional_bearer),
+) -> uuid.UUID | None:
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET,
+            audience="fastapi-users:auth",
+            algorithms=["HS256"],
+        )
+        return uuid.UUID(payload["sub"])
+    except Exception:
+        return None
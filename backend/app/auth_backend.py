@@ -1,12 +1,42 @@
 # app/auth_backend.py
+from itsdangerous import TimestampSigner
 from sqladmin.authentication import AuthenticationBackend
 from sqlalchemy import select
+from starlette.middleware.sessions import SessionMiddleware
 from starlette.requests import Request
 
 from .database import async_session_maker
 from .models import User
 
 
+class _CachedKeyTimestampSigner(TimestampSigner):
+    """
+    TimestampSigner that derives the HMAC signing key once at construction.
+    itsdangerous normally re-runs derive_key() (a SHA hash of secret+salt)
+    on EVERY sign/unsign — i.e. on every request carrying a session cookie.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._derived_key = super().derive_key()
+
+    def derive_key(self, secret_key=None):
+        if secret_key is None:
+            return self._derived_key
+        return super().derive_key(secret_key)
+
+
+class FastSessionMiddleware(SessionMiddleware):
+    """
+    SessionMiddleware with a precomputed signing key, so verifying the
+    admin session cookie costs one HMAC instead of HMAC + key derivation.
+    """
+
+    def __init__(self, app, secret_key, **kwargs):
+        super().__init__(app, secret_key, **kwargs)
+        self.signer = _CachedKeyTimestampSigner(str(secret_key))
+
+
 class AdminAuthBackend(AuthenticationBackend):
     """
     Custom authentication backend for SQLAdmin.
@@ -31,10 +61,8 @@ class AdminAuthBackend(AuthenticationBackend):
             if not user:
                 return False
 
-            # Verify password using fastapi-users manager
-            from fastapi_users.password import PasswordHelper
-
-            password_helper = PasswordHelper()
+            # Verify password using the same helper as the UserManager
+            from .manager import password_helper
 
             verified, updated_hash = password_helper.verify_and_update(
                 password, user.hashed_password
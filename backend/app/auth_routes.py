@@ -0,0 +1,106 @@
+# app/auth_routes.py
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.security import OAuth2PasswordRequestForm
+
+from .auth import (
+    get_access_token_strategy,
+    get_refresh_token_strategy,
+    get_user_manager,
+    invalidate_cached_token,
+)
+from .config import get_settings
+from .logging_config import logger
+from .rate_limit import login_rate_limiter, refresh_rate_limiter
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+# Refresh-token cookie attributes, computed ONCE instead of re-reading
+# settings and rebuilding the kwargs on every login/refresh response.
+_REFRESH_COOKIE_KW = dict(
+    key="refresh_token",
+    max_age=604800,  # 7 days
+    httponly=True,
+    secure=get_settings().ENVIRONMENT == "production",
+    samesite="lax",
+)
+
+
+@router.post("/login", dependencies=[Depends(login_rate_limiter)])
+async def login(
+    response: Response,
+    credentials: OAuth2PasswordRequestForm = Depends(),
+    user_manager=Depends(get_user_manager),
+):
+    """
+    Login endpoint: returns access token in body, sets refresh token in cookie.
+    """
+    logger.info(f"👤 Login attempt for user: {credentials.username}")
+
+    user = await user_manager.authenticate(credentials)
+    if user is None or not user.is_active:
+        logger.warning(f"⚠️ Failed login for user: {credentials.username}")
+        raise HTTPException(status_code=400, detail="LOGIN_BAD_CREDENTIALS")
+
+    # Create Access Token
+    access_strategy = get_access_token_strategy()
+    access_token = await access_strategy.write_token(user)
+
+    # Create Refresh Token
+    refresh_strategy = get_refresh_token_strategy()
+    refresh_token = await refresh_strategy.write_token(user)
+
+    # Set the secure refresh token cookie
+    response.set_cookie(value=refresh_token, **_REFRESH_COOKIE_KW)
+    logger.success(f"✅ User {user.email} logged in successfully.")
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post("/refresh", dependencies=[Depends(refresh_rate_limiter)])
+async def refresh_token(
+    request: Request,
+    response: Response,
+    user_manager=Depends(get_user_manager),
+):
+    """
+    Uses the refresh token from cookie to generate a new access token.
+    """
+    refresh_token_value = request.cookies.get("refresh_token")
+    if not refresh_token_value:
+        raise HTTPException(
+            status_code=401, detail="Refresh token not found. Please login again."
+        )
+    try:
+        strategy = get_refresh_token_strategy()
+        user = await strategy.read_token(refresh_token_value, user_manager)
+        if user is None or not user.is_active:
+            raise HTTPException(
+                status_code=401, detail="Invalid refresh token or inactive user"
+            )
+
+        access_strategy = get_access_token_strategy()
+        new_access_token = await access_strategy.write_token(user)
+
+        refresh_strategy = get_refresh_token_strategy()
+        new_refresh_token = await refresh_strategy.write_token(user)
+
+        # The old refresh token is rotated out — drop it from the cache
+        invalidate_cached_token(refresh_token_value)
+
+        response.set_cookie(value=new_refresh_token, **_REFRESH_COOKIE_KW)
+        return {"access_token": new_access_token, "token_type": "bearer"}
+    except Exception:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired refresh token. Please login again.",
+        )
+
+
+@router.post("/logout")
+async def logout(response: Response):
+    """
+    Clears the refresh token cookie.
+    """
+    logger.info("🚪 Logout request received.")
+    response.delete_cookie(key="refresh_token")
+    logger.success("✅ Refresh token cookie cleared and user logged out.")
+    return {"message": "Successfully logged out"}
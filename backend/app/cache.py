@@ -0,0 +1,97 @@
+# app/cache.py
+import asyncio
+from typing import Optional
+
+from cachetools import TTLCache
+
+from .logging_config import logger
+
+# Feed pages are keyed by their weak ETag, so a stale body can never be
+# served under a fresh tag — the TTL only bounds memory, not correctness.
+FEED_TTL = 30
+
+_FEED_PREFIX = "feed-cache:"
+
+# In-process tier: always on, shared-nothing, microsecond lookups.
+_local: TTLCache = TTLCache(maxsize=256, ttl=FEED_TTL)
+
+# The feed's ETag probe row (count/max(updated_at)/likes sum) keyed by
+# search term. A few seconds of staleness is already allowed by the
+# endpoint's Cache-Control max-age, and mutations clear it eagerly.
+PROBE_TTL = 5
+_probe: TTLCache = TTLCache(maxsize=64, ttl=PROBE_TTL)
+
+# Redis tier: shared across workers, attached at startup when REDIS_URL
+# is configured (same connection the rate limiter uses).
+_redis = None
+
+
+def init_cache(redis_conn) -> None:
+    """Attach the shared Redis connection as the second cache tier."""
+    global _redis
+    _redis = redis_conn
+    logger.success("📦 Feed cache backed by Redis.")
+
+
+async def feed_cache_get(etag: str) -> Optional[bytes]:
+    body = _local.get(etag)
+    if body is not None:
+        return body
+    if _redis is not None:
+        try:
+            cached = await _redis.get(_FEED_PREFIX + etag)
+        except Exception as e:
+            logger.warning(f"⚠️ Feed cache read failed: {e}")
+            return None
+        if cached is not None:
+            body = cached.encode() if isinstance(cached, str) else cached
+            _local[etag] = body
+            return body
+    return None
+
+
+async def feed_cache_set(etag: str, body: bytes) -> None:
+    _local[etag] = body
+    if _redis is not None:
+        try:
+            await _redis.set(_FEED_PREFIX + etag, body, ex=FEED_TTL)
+        except Exception as e:
+            logger.warning(f"⚠️ Feed cache write failed: {e}")
+
+
+def probe_cache_get(search_key: str):
+    return _probe.get(search_key)
+
+
+def probe_cache_set(search_key: str, row) -> None:
+    _probe[search_key] = row
+
+
+# Strong refs to in-flight purge tasks — the event loop only keeps a
+# weak reference, so an unreferenced task can be garbage-collected
+# before it finishes.
+_purge_tasks: set = set()
+
+
+async def _purge_redis_feed() -> None:
+    try:
+        keys = [key async for key in _redis.scan_iter(match=_FEED_PREFIX + "*")]
+        if keys:
+            await _redis.unlink(*keys)
+    except Exception as e:
+        logger.warning(f"⚠️ Feed cache purge failed: {e}")
+
+
+def invalidate_feed() -> None:
+    """Drop cached feed pages after a mutation.
+
+    ETag keying already guarantees freshness; this just stops dead pages
+    from occupying cache slots until their TTL. The Redis purge runs as a
+    fire-and-forget task so mutations never wait on a SCAN.
+    """
+    _local.clear()
+    _probe.clear()
+    if _redis is not None:
+        task = asyncio.get_running_loop().create_task(_purge_redis_feed())
+        _purge_tasks.add(task)
+        task.add_done_callback(_purge_tasks.discard)
@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     # --- JWT ---
     JWT_SECRET: str
 
+    # --- Redis (rate limiting; optional in development) ---
+    REDIS_URL: str | None = None
+
     # --- Environment ---
     ENVIRONMENT: str = "development"
 
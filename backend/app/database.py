@@ -5,9 +5,35 @@ from .config import get_settings
 # Get the database URL from our settings
 DATABASE_URL = get_settings().DATABASE_URL
 
+# Pool sized to expected concurrent requests — the default pool_size=5
+# serializes request bursts behind connection acquisition. pre_ping drops
+# dead connections before use; recycle avoids stale server-side timeouts.
+POOL_SIZE = 20
+
+# asyncpg keeps server-side prepared statements per connection; raising
+# the cache above the default 100 lets every hot statement shape stay
+# prepared (skipping server parse/plan). Dialect-specific, so only set
+# when actually running on asyncpg. NOTE: if a pgbouncer in transaction
+# mode ever fronts the DB, this must go to 0.
+_connect_args = {}
+if DATABASE_URL.startswith("postgresql+asyncpg"):
+    _connect_args["prepared_statement_cache_size"] = 500
+
 # Create the async engine
-# 'echo=True' is great for development, it logs all SQL queries
-engine = create_async_engine(DATABASE_URL, echo=True)
+# 'echo' logs all SQL queries — development only, it costs per statement
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=get_settings().ENVIRONMENT == "development",
+    pool_size=POOL_SIZE,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Compiled-statement cache: the default 500 slots churn once the
+    # feed/auth/admin statement shapes pile up; 1200 keeps them all hot
+    # so repeated requests skip SQL compilation entirely.
+    query_cache_size=1200,
+    connect_args=_connect_args,
+)
 
 # Create the session factory
 # This is what we'll use to create new sessions
@@ -1,13 +1,60 @@
 # app/dependencies.py
+import uuid
+
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
 from .models import User
 from .database import get_db_session
 
+# The auth path runs on EVERY protected request — pin the loaded columns
+# explicitly so the statement shape stays stable (and future wide columns
+# never ride along). lazy="raise" on the model already keeps collections
+# out; full_name is included because /users/me serializes it.
+_AUTH_USER_COLS = load_only(
+    User.id,
+    User.email,
+    User.hashed_password,
+    User.is_active,
+    User.is_superuser,
+    User.is_verified,
+    User.full_name,
+)
+
+# Compiled once at import — the login path runs this on every attempt.
+# Lowercasing the parameter in Python (instead of lower(:email) in SQL)
+# keeps the WHERE clause sargable for the ix_user_email_lower index.
+_GET_BY_EMAIL_STMT = (
+    select(User)
+    .options(_AUTH_USER_COLS)
+    .where(func.lower(User.email) == bindparam("email"))
+)
+
+# Token verification resolves the user by PK on every request.
+_GET_BY_ID_STMT = (
+    select(User).options(_AUTH_USER_COLS).where(User.id == bindparam("uid"))
+)
+
+
+class UserDatabase(SQLAlchemyUserDatabase):
+    """SQLAlchemyUserDatabase with precompiled, column-pinned lookups."""
+
+    async def get(self, id: uuid.UUID) -> User | None:
+        result = await self.session.execute(_GET_BY_ID_STMT, {"uid": id})
+        return result.unique().scalar_one_or_none()
+
+    async def get_by_email(self, email: str) -> User | None:
+        result = await self.session.execute(
+            _GET_BY_EMAIL_STMT, {"email": email.lower()}
+        )
+        return result.unique().scalar_one_or_none()
+
 
 async def get_user_db(session: AsyncSession = Depends(get_db_session)):
     """
     Dependency to get the SQLAlchemyUserDatabase adapter.
     """
-    yield SQLAlchemyUserDatabase(session, User)
+    yield UserDatabase(session, User)
@@ -28,77 +28,45 @@ LEVEL_EMOJIS = {
 }
 
 
-def formatter(record):
-    """Custom console log format (safe for missing extras)."""
-    level_name = record["level"].name
-    emoji = LEVEL_EMOJIS.get(level_name, "💬")
-    user = record["extra"].get("user", "system")
-    method = record["extra"].get("method", "")
-    path = record["extra"].get("path", "")
-
-    # 👇 FIX: Escape the function name to prevent color tag errors
-    func_name = record["function"].replace("<", r"\<").replace(">", r"\>")
-
-    if record["name"].startswith("sqlalchemy"):
-        emoji = LEVEL_EMOJIS["SQLALCHEMY"]
-        return (
-            f"<green>{record['time']:YYYY-MM-DD HH:mm:ss}</green> "
-            f"| <cyan>{emoji} SQL</cyan> "
-            f"| <cyan>{record['name']}</cyan>:<cyan>{func_name}</cyan>:<cyan>{record['line']}</cyan> "
-            f"| 👤 <magenta>{user}</magenta> "
-            f"- <cyan>{record['message']}</cyan>\n"
-        )
-
-    return (
-        f"<green>{record['time']:YYYY-MM-DD HH:mm:ss}</green> "
-        f"| <level>{emoji} {level_name:<8}</level> "
-        f"| <cyan>{record['name']}</cyan>:<cyan>{func_name}</cyan>:<cyan>{record['line']}</cyan> "
-        f"| <blue>{method} {path}</blue> "
-        f"| 👤 <magenta>{user}</magenta> "
-        f"- <level>{record['message']}</level>\n"
-    )
-
-
-LOG_LEVEL = "DEBUG" if IS_DEVELOPMENT else "INFO"
-
-logger.add(
-    sys.stderr,
-    format=formatter,
-    colorize=True,
-    level=LOG_LEVEL,
-    enqueue=not IS_DEVELOPMENT,
-    backtrace=True,
-    diagnose=False,
+def _patch_emoji(record):
+    """Attach the level emoji so the static format strings can use it."""
+    if record["name"] and record["name"].startswith("sqlalchemy"):
+        record["extra"]["emoji"] = LEVEL_EMOJIS["SQLALCHEMY"]
+    else:
+        record["extra"]["emoji"] = LEVEL_EMOJIS.get(record["level"].name, "💬")
+
+
+# Default extras + emoji patcher. With these in place, loguru compiles the
+# format strings below ONCE instead of calling a Python formatter (dict
+# lookups, f-string assembly, startswith checks) for every single record.
+logger.configure(
+    extra={"user": "system", "method": "", "path": ""},
+    patcher=_patch_emoji,
 )
 
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
+    "| <level>{extra[emoji]} {level: <8}</level> "
+    "| <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> "
+    "| <blue>{extra[method]} {extra[path]}</blue> "
+    "| 👤 <magenta>{extra[user]}</magenta> "
+    "- <level>{message}</level>"
+)
 
-def file_formatter(record):
-    user = record["extra"].get("user", "system")
-    method = record["extra"].get("method", "")
-    path = record["extra"].get("path", "")
-    emoji = LEVEL_EMOJIS.get(record["level"].name, "💬")
-
-    # 👇 FIX: Escape the function name
-    func_name = record["function"].replace("<", r"\<").replace(">", r"\>")
-
-    if record["name"].startswith("sqlalchemy"):
-        emoji = LEVEL_EMOJIS["SQLALCHEMY"]
+FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {extra[emoji]} {level: <8} | "
+    "{name}:{function}:{line} | "
+    "{extra[method]} {extra[path]} | {extra[user]} - {message}"
+)
 
-    return (
-        f"{record['time']:YYYY-MM-DD HH:mm:ss} | {emoji} {record['level'].name:<8} | "
-        f"{record['name']}:{func_name}:{record['line']} | "
-        f"{method} {path} | {user} - {record['message']}\n"
-    )
+LOG_LEVEL = "DEBUG" if IS_DEVELOPMENT else "INFO"
 
 
-logger.add(
-    "logs/{time:YYYY-MM-DD}.log",
-    rotation="1 week",
-    compression="zip",
-    level="DEBUG",
-    format=file_formatter,
-    enqueue=not IS_DEVELOPMENT,
-)
+# Bound once: the frame walk below runs per intercepted record, and
+# re-resolving logging.__file__ / sys._getframe costs a global + attribute
+# lookup per iteration.
+_LOGGING_FILE = logging.__file__
+_getframe = sys._getframe
 
 
 class InterceptHandler(logging.Handler):
@@ -108,8 +76,19 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        frame, depth = sys._getframe(6), 6
-        while frame and frame.f_code.co_filename == logging.__file__:
+        # SQLAlchemy logs straight through logging.Logger.handle, so the
+        # depth is fixed — skip the frame walk (sys._getframe + f_back
+        # traversal is slow, and this fires on EVERY SQL statement).
+        # Depth 6 is the first frame past the stdlib logging machinery,
+        # i.e. exactly where the general walk below starts.
+        if record.name.startswith("sqlalchemy"):
+            logger.opt(depth=6, exception=record.exc_info).log(
+                level, record.getMessage()
+            )
+            return
+
+        frame, depth = _getframe(6), 6
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -118,30 +97,68 @@ class InterceptHandler(logging.Handler):
         )
 
 
-logging.root.handlers = [InterceptHandler()]
-logging.root.setLevel(0)
+# Guard so an accidental double execution of this module (e.g. imported
+# under two different names) can't add duplicate sinks — which would
+# silently double every log write and the zip work on rotation.
+_configured = False
+
+
+def _configure() -> None:
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    logger.add(
+        sys.stderr,
+        format=CONSOLE_FORMAT,
+        colorize=True,
+        level=LOG_LEVEL,
+        enqueue=not IS_DEVELOPMENT,
+        backtrace=True,
+        diagnose=False,
+    )
+
+    logger.add(
+        "logs/{time:YYYY-MM-DD}.log",
+        rotation="1 week",
+        compression="zip",
+        level="DEBUG",
+        format=FILE_FORMAT,
+        enqueue=not IS_DEVELOPMENT,
+    )
+
+    logging.root.handlers = [InterceptHandler()]
+    logging.root.setLevel(0)
+
+    for name in ["uvicorn", "uvicorn.access", "uvicorn.error"]:
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
+
+    # Per-statement SQL logging is a dev convenience only — in production
+    # it fires an intercepted record for every query on the hot path.
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.INFO if IS_DEVELOPMENT else logging.WARNING
+    )
+    logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
 
-for name in ["uvicorn", "uvicorn.access", "uvicorn.error"]:
-    logging.getLogger(name).handlers = []
-    logging.getLogger(name).propagate = True
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("sqlalchemy"):
+            sa_logger = logging.getLogger(name)
+            sa_logger.handlers.clear()
+            sa_logger.addHandler(InterceptHandler())
+            sa_logger.propagate = False
 
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("python_multipart").setLevel(logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.INFO)
+    logging.getLogger("httpcore").setLevel(logging.INFO)
 
-for name in list(logging.root.manager.loggerDict):
-    if name.startswith("sqlalchemy"):
-        sa_logger = logging.getLogger(name)
-        sa_logger.handlers.clear()
-        sa_logger.addHandler(InterceptHandler())  # 👈 TYPO FIXED
-        sa_logger.propagate = False
+    # Silence noisy AWS/boto3 debug logs
+    logging.getLogger("botocore").setLevel(logging.INFO)
+    logging.getLogger("boto3").setLevel(logging.INFO)
+    logging.getLogger("s3transfer").setLevel(logging.INFO)
+    logging.getLogger("urllib3").setLevel(logging.INFO)
 
-logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-logging.getLogger("python_multipart").setLevel(logging.INFO)
-logging.getLogger("httpx").setLevel(logging.INFO)
-logging.getLogger("httpcore").setLevel(logging.INFO)
 
-# Silence noisy AWS/boto3 debug logs
-logging.getLogger("botocore").setLevel(logging.INFO)
-logging.getLogger("boto3").setLevel(logging.INFO)
-logging.getLogger("s3transfer").setLevel(logging.INFO)
-logging.getLogger("urllib3").setLevel(logging.INFO)
+_configure()
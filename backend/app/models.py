@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -13,6 +13,9 @@ from .database import Base
 # ===============================
 class Like(Base):
     __tablename__ = "likes"
+    # The PK leads with user_id; the hot feed/toggle lookups filter by
+    # post_id first, so they need their own covering index.
+    __table_args__ = (Index("ix_likes_post_user", "post_id", "user_id"),)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
@@ -26,8 +29,8 @@ class Like(Base):
     )
 
     # 👇 Relationships (explicit, clean)
-    user: Mapped["User"] = relationship(back_populates="likes")
-    post: Mapped["Post"] = relationship(back_populates="likes")
+    user: Mapped["User"] = relationship(back_populates="likes", lazy="raise")
+    post: Mapped["Post"] = relationship(back_populates="likes", lazy="raise")
 
 
 # ===============================
@@ -36,20 +39,29 @@ class Like(Base):
 class User(SQLAlchemyBaseUserTableUUID, Base):
     full_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
+    # lazy="raise" everywhere: the auth path loads a User on EVERY request,
+    # and lazy="selectin" used to drag posts/comments/likes along with it.
+    # Callers that need a collection opt in with selectinload()/joinedload().
     posts: Mapped[list["Post"]] = relationship(
-        back_populates="owner", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="owner", cascade="all, delete-orphan", lazy="raise"
     )
 
     comments: Mapped[list["Comment"]] = relationship(
-        back_populates="owner", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="owner", cascade="all, delete-orphan", lazy="raise"
     )
 
     # 👇 Likes (clean back_populates + fast loading)
     likes: Mapped[list["Like"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="user", cascade="all, delete-orphan", lazy="raise"
     )
 
 
+# fastapi-users looks users up by lower(email), which the plain unique
+# index on email can't serve — this functional index makes login an
+# index lookup instead of a sequential scan.
+Index("ix_user_email_lower", func.lower(User.email), unique=True)
+
+
 # ===============================
 # 👍 POST MODEL (Updated)
 # ===============================
@@ -62,6 +74,12 @@ class Post(Base):
     image_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     video_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
+    # Denormalized: maintained by AFTER INSERT/DELETE triggers on likes,
+    # so the feed reads the count from the row it already fetched.
+    likes_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -73,23 +91,37 @@ class Post(Base):
 
     owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user.id"))
 
-    owner: Mapped["User"] = relationship(back_populates="posts", lazy="selectin")
+    owner: Mapped["User"] = relationship(back_populates="posts", lazy="raise")
 
     comments: Mapped[list["Comment"]] = relationship(
-        back_populates="post", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="post",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
     # 👇 Likes (clean back_populates + fast loading)
     likes: Mapped[list["Like"]] = relationship(
-        back_populates="post", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="post",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
+# Keyset pagination seeks on (created_at, id) DESC — this composite index
+# makes every feed page an index scan from the cursor position.
+Index("ix_posts_created_id", Post.created_at.desc(), Post.id.desc())
+
+
 # ===============================
 # 👍 COMMENT MODEL (Updated)
 # ===============================
 class Comment(Base):
     __tablename__ = "comments"
+    # Thread pages filter by post_id and seek on created_at — this
+    # composite index serves the keyset scan without a sort.
+    __table_args__ = (Index("ix_comment_post_created", "post_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     content: Mapped[str] = mapped_column(Text)
@@ -104,8 +136,10 @@ class Comment(Base):
     )
 
     owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user.id"))
-    post_id: Mapped[int] = mapped_column(ForeignKey("posts.id"))
+    post_id: Mapped[int] = mapped_column(
+        ForeignKey("posts.id", ondelete="CASCADE")
+    )
 
-    owner: Mapped["User"] = relationship(back_populates="comments", lazy="selectin")
+    owner: Mapped["User"] = relationship(back_populates="comments", lazy="raise")
 
-    post: Mapped["Post"] = relationship(back_populates="comments", lazy="selectin")
+    post: Mapped["Post"] = relationship(back_populates="comments", lazy="raise")
@@ -1,15 +1,52 @@
 # app/posts.py
 
+import asyncio
+import base64
+import hashlib
 import os
+from datetime import datetime
+from pathlib import Path
 from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import and_, func, or_, select
+from uuid import UUID
+
+import orjson
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    false,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from .auth import current_active_verified_user
-from .database import get_db_session
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from .auth import current_active_verified_user, optional_viewer_id
+from .cache import (
+    feed_cache_get,
+    feed_cache_set,
+    invalidate_feed,
+    probe_cache_get,
+    probe_cache_set,
+)
+from .database import async_session_maker, get_db_session
 from .logging_config import logger
 from .models import Comment, Like, Post, User
 from .schemas import (
@@ -26,6 +63,85 @@ STATIC_DIR = "app/static/images"
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
+# Compiled once at import: validate + serialize the feed page straight to
+# JSON bytes in pydantic-core, bypassing FastAPI's per-item response-model
+# validation and the Python-level jsonable_encoder pass.
+_POSTS_PAGE = TypeAdapter(PaginatedPostResponse)
+_POST_DETAILS = TypeAdapter(PostReadWithDetails)
+_COMMENT_LIST = TypeAdapter(List[CommentReadWithUser])
+
+_CACHE_CONTROL = "private, max-age=5"
+
+# Singleflight: identical feed pages being built right now, keyed by
+# ETag. Concurrent cache-missing requests await the first builder's
+# Future instead of stampeding the DB with the same page query.
+_inflight: dict = {}
+
+
+def _weak_etag(*parts) -> str:
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+
+def _cleanup_image(image_url: str) -> None:
+    """Remove a replaced/orphaned image file. Blocking — run off-loop."""
+    try:
+        filename = os.path.basename(image_url)
+        # unlink(missing_ok=True) fuses the exists+remove pair into one
+        # syscall — and there's no TOCTOU window between them.
+        Path(STATIC_DIR, filename).unlink(missing_ok=True)
+        logger.info(f"Deleted image {filename}")
+    except Exception as e:
+        logger.error(f"Failed to delete image: {e}")
+
+
+def _encode_cursor(post: "Post") -> str:
+    raw = orjson.dumps({"t": post.created_at.isoformat(), "i": post.id})
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(data["t"]), int(data["i"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# Statement templates built ONCE with bindparam(): the compiled-statement
+# cache gets a stable key, so each request pays a dict lookup instead of
+# statement construction + SQL compilation.
+_POST_EXISTS_STMT = select(Post.id).where(Post.id == bindparam("pid"))
+_POST_OWNER_STMT = select(Post.owner_id).where(Post.id == bindparam("pid"))
+_POST_IMAGE_STMT = select(Post.image_url).where(Post.id == bindparam("pid"))
+# Comment thread pages: bounded keyset scans on ix_comment_post_created.
+_COMMENTS_PAGE_STMT = (
+    select(Comment)
+    .where(Comment.post_id == bindparam("pid"))
+    .options(selectinload(Comment.owner))
+    .order_by(Comment.created_at.asc(), Comment.id.asc())
+    .limit(bindparam("lim"))
+)
+_COMMENTS_PAGE_AFTER_STMT = _COMMENTS_PAGE_STMT.where(
+    Comment.created_at > bindparam("after")
+)
+
+# Post detail embeds at most this many comments; clients page the rest
+# through GET /posts/{id}/comments/.
+POST_DETAIL_COMMENTS = 20
+
+_POST_WITH_OWNER_STMT = (
+    select(Post).options(joinedload(Post.owner)).where(Post.id == bindparam("pid"))
+)
+_RECENT_COMMENTS_STMT = (
+    select(Comment)
+    .where(Comment.post_id == bindparam("pid"))
+    # joinedload: to-one owner comes back in the same statement
+    .options(joinedload(Comment.owner))
+    .order_by(Comment.created_at.asc())
+    .limit(POST_DETAIL_COMMENTS)
+)
+
 
 # ----------------------------------------
 # 1. Create Post
@@ -36,77 +152,204 @@ async def create_post(
     user: User = Depends(current_active_verified_user),
     session: AsyncSession = Depends(get_db_session),
 ):
-    new_post = Post(**post.model_dump(), owner_id=user.id)
-    session.add(new_post)
+    # INSERT ... RETURNING folds the refresh SELECT (id, created_at, ...)
+    # into the insert — one round-trip instead of two
+    stmt = (
+        insert(Post)
+        .values(**post.model_dump(), owner_id=user.id)
+        .returning(Post)
+    )
+    new_post = (await session.execute(stmt)).scalar_one()
     await session.commit()
-    await session.refresh(new_post)
+    invalidate_feed()
     return new_post
 
 
+# ----------------------------------------
+# 1.1 Bulk Create Posts
+# ----------------------------------------
+@router.post(
+    "/bulk", response_model=List[PostRead], status_code=status.HTTP_201_CREATED
+)
+async def bulk_create_posts(
+    posts: List[PostCreate],
+    user: User = Depends(current_active_verified_user),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create many posts in one round-trip (seeding / imports).
+    """
+    if not posts:
+        return []
+
+    # One multi-row INSERT ... RETURNING instead of N add()+commit()
+    # cycles — N round-trips collapse into a single statement.
+    stmt = (
+        insert(Post)
+        .values([{**p.model_dump(), "owner_id": user.id} for p in posts])
+        .returning(Post)
+    )
+    new_posts = (await session.execute(stmt)).scalars().all()
+    await session.commit()
+    invalidate_feed()
+    return new_posts
+
+
 # ----------------------------------------
 # 2. Get All Posts (WITH likes)
 # ----------------------------------------
 @router.get("/", response_model=PaginatedPostResponse)
 async def get_all_posts(
+    request: Request,
     session: AsyncSession = Depends(get_db_session),
-    user: Optional[User] = Depends(current_active_verified_user),
+    viewer_id: Optional[UUID] = Depends(optional_viewer_id),
     skip: int = 0,
     limit: int = 10,
     search: str = None,
+    cursor: Optional[str] = None,
 ):
-    posts_query = select(Post).order_by(Post.created_at.desc())
-    count_query = select(func.count()).select_from(Post)
-
+    # Keyset pagination: a cursor pins the page to (created_at, id) of the
+    # last row seen, so Postgres walks the index from there instead of
+    # scanning and discarding `skip` rows. skip/limit still works for
+    # clients that haven't adopted cursors.
+    cursor_key = _decode_cursor(cursor) if cursor else None
+    search_filter = None
     if search:
         search_term = f"%{search}%"
         search_filter = or_(
             Post.title.ilike(search_term),
             Post.content.ilike(search_term),
         )
-        posts_query = posts_query.where(search_filter)
-        count_query = count_query.where(search_filter)
-
-    # Count total
-    total = (await session.execute(count_query)).scalar_one()
-
-    # Fetch posts
-    posts_result = await session.execute(posts_query.offset(skip).limit(limit))
-    posts = posts_result.scalars().all()
-
-    # Attach likes_count and user_has_liked
-    post_ids = [p.id for p in posts]
-    if not post_ids:
-        return {"total": total, "posts": []}
-
-    # Count likes per post
-    # 👇 FIX: Changed func.count(Like.id) to func.count()
-    likes_counts_query = (
-        select(Like.post_id, func.count())
-        .where(Like.post_id.in_(post_ids))
-        .group_by(Like.post_id)
+
+    # Cheap freshness probe: the feed only changes when a post is
+    # written/edited or a like toggles, so hash those into a weak ETag.
+    # All three aggregates scan only posts — one round-trip, one table.
+    probe_query = select(
+        func.count().label("total"),
+        func.max(Post.updated_at).label("max_updated"),
+        func.coalesce(func.sum(Post.likes_count), 0).label("likes_total"),
+    ).select_from(Post)
+    if search_filter is not None:
+        probe_query = probe_query.where(search_filter)
+
+    # likes_count is denormalized onto posts (trigger-maintained), so the
+    # page query only adds an EXISTS for "did this viewer like it".
+    liked_expr = (
+        select(1)
+        .where(and_(Like.post_id == Post.id, Like.user_id == viewer_id))
+        .exists()
+        if viewer_id
+        else false()
+    )
+    # No owner load here: PostRead has no owner field, so the feed never
+    # touches Post.owner (lazy="raise" would scream if it did).
+    posts_query = (
+        select(Post, liked_expr.label("user_has_liked"))
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(limit)
     )
-    likes_counts_result = await session.execute(likes_counts_query)
-    likes_counts = dict(likes_counts_result.all())
-
-    # Fetch which posts this user liked
-    user_likes = []
-    if user:
-        user_likes = [
-            row[0]
-            for row in (
-                await session.execute(
-                    select(Like.post_id).where(
-                        and_(Like.post_id.in_(post_ids), Like.user_id == user.id)
-                    )
+    if cursor_key is not None:
+        # O(1) page seek on ix_posts_created_id regardless of depth
+        posts_query = posts_query.where(
+            tuple_(Post.created_at, Post.id) < tuple_(*cursor_key)
+        )
+    else:
+        posts_query = posts_query.offset(skip)
+    if search_filter is not None:
+        posts_query = posts_query.where(search_filter)
+
+    if_none_match = request.headers.get("if-none-match")
+    rows = None
+    # The probe row only varies by search term, so burst traffic reuses it
+    # for a few seconds (mutations clear it; staleness is bounded by the
+    # same window Cache-Control already allows).
+    probe_key = search or ""
+    probe = probe_cache_get(probe_key)
+    if probe is None:
+        if if_none_match is None:
+            # No conditional header, so a 304 is impossible and the page
+            # WILL be needed — pipeline probe and page on two pooled
+            # connections (AsyncSession can't run statements concurrently)
+            # so wall time is the slower query, not the sum.
+            async with async_session_maker() as page_session:
+                probe_result, page_result = await asyncio.gather(
+                    session.execute(probe_query),
+                    page_session.execute(posts_query),
                 )
-            ).all()
-        ]
+                rows = page_result.all()
+            probe = probe_result.first()
+        else:
+            probe = (await session.execute(probe_query)).first()
+        probe_cache_set(probe_key, probe)
+
+    total = probe.total
+    etag = _weak_etag(
+        probe.max_updated,
+        total,
+        probe.likes_total,
+        viewer_id or "",
+        skip,
+        limit,
+        search,
+        cursor,
+    )
+
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if if_none_match == etag:
+        # Client already has this page — skip the queries AND serialization
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    for p in posts:
-        p.likes_count = likes_counts.get(p.id, 0)
-        p.user_has_liked = p.id in user_likes
+    cached_body = await feed_cache_get(etag)
+    if cached_body is not None:
+        return Response(
+            content=cached_body, media_type="application/json", headers=headers
+        )
 
-    return {"total": total, "posts": posts}
+    flight = None
+    if rows is None:
+        # Someone may already be building exactly this page — await their
+        # Future instead of issuing a duplicate query (cache stampede).
+        flight = _inflight.get(etag)
+        if flight is not None:
+            body = await flight
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
+        flight = asyncio.get_running_loop().create_future()
+        _inflight[etag] = flight
+
+    try:
+        if rows is None:
+            rows = (await session.execute(posts_query)).all()
+        posts = []
+        for p, user_has_liked in rows:
+            p.user_has_liked = user_has_liked
+            posts.append(p)
+
+        next_cursor = _encode_cursor(posts[-1]) if len(posts) == limit else None
+
+        # Serialize straight to JSON bytes in pydantic-core; returning a
+        # Response skips FastAPI's response-model re-validation pass.
+        page = _POSTS_PAGE.validate_python(
+            {"total": total, "posts": posts, "next_cursor": next_cursor},
+            from_attributes=True,
+        )
+        body = _POSTS_PAGE.dump_json(page)
+    except BaseException as e:
+        if flight is not None and not flight.done():
+            flight.set_exception(e)
+            # Waiters re-raise; keep "never retrieved" noise out of logs
+            # when nobody was actually waiting.
+            flight.exception()
+        raise
+    finally:
+        if flight is not None:
+            _inflight.pop(etag, None)
+
+    if flight is not None:
+        flight.set_result(body)
+    await feed_cache_set(etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # ----------------------------------------
@@ -115,45 +358,95 @@ async def get_all_posts(
 @router.get("/{post_id}", response_model=PostReadWithDetails)
 async def get_post_by_id(
     post_id: int,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_db_session),
-    user: Optional[User] = Depends(current_active_verified_user),
+    viewer_id: Optional[UUID] = Depends(optional_viewer_id),
 ):
-    query = (
-        select(Post)
-        .where(Post.id == post_id)
-        .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
-        )
+    # Cheap freshness probe before the heavy joined query: updated_at plus
+    # the like/comment counts and the viewer's like, all index probes on
+    # likes(post_id, user_id), in one round-trip via scalar subqueries.
+    liked_expr = (
+        select(1)
+        .where(and_(Like.post_id == post_id, Like.user_id == viewer_id))
+        .exists()
+        if viewer_id
+        else false()
     )
-    result = await session.execute(query)
-    post = result.scalar_one_or_none()
+    meta = (
+        await session.execute(
+            select(
+                Post.updated_at,
+                Post.likes_count,
+                select(func.count())
+                .select_from(Comment)
+                .where(Comment.post_id == post_id)
+                .scalar_subquery()
+                .label("comments_count"),
+                # Comment edits touch neither the post row nor the count,
+                # so the ETag must also track the newest comment edit.
+                select(func.max(Comment.updated_at))
+                .where(Comment.post_id == post_id)
+                .scalar_subquery()
+                .label("comments_updated"),
+                liked_expr.label("user_has_liked"),
+            ).where(Post.id == post_id)
+        )
+    ).first()
 
-    if not post:
+    if meta is None:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    # Likes count
-    # 👇 FIX: Ensure this uses func.count() without arguments inside select() if Like.id is missing
-    likes_count = (
-        await session.execute(
-            select(func.count()).select_from(Like).where(Like.post_id == post_id)
+    user_has_liked = bool(meta.user_has_liked)
+
+    etag = _weak_etag(
+        post_id,
+        meta.updated_at,
+        meta.likes_count,
+        meta.comments_count,
+        meta.comments_updated,
+        user_has_liked,
+        viewer_id or "",
+    )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    if request.headers.get("if-none-match") == etag:
+        # Unchanged — skip the joined query and serialization entirely
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=dict(response.headers),
         )
-    ).scalar_one()
 
-    user_has_liked = False
-    if user:
-        user_has_liked = (
-            await session.execute(
-                select(func.count())
-                .select_from(Like)
-                .where(and_(Like.post_id == post_id, Like.user_id == user.id))
-            )
-        ).scalar_one() > 0
+    # Post+owner and the first page of comments (each a single JOINed
+    # statement) run concurrently on two pooled connections. Bounding the
+    # embedded comments keeps popular posts from ballooning the payload —
+    # clients page the rest via /posts/{id}/comments/.
+    async with async_session_maker() as comments_session:
+        post_result, comments_result = await asyncio.gather(
+            session.execute(_POST_WITH_OWNER_STMT, {"pid": post_id}),
+            comments_session.execute(_RECENT_COMMENTS_STMT, {"pid": post_id}),
+        )
+        comments = comments_result.unique().scalars().all()
+    post = post_result.unique().scalar_one_or_none()
+
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
 
-    post.likes_count = likes_count
+    # likes_count rides along on the row itself now; attach the per-viewer
+    # flag and the bounded comment page without triggering lazy="raise".
     post.user_has_liked = user_has_liked
+    set_committed_value(post, "comments", comments)
 
-    return post
+    # Serialize in pydantic-core and return the bytes directly — same
+    # trick as the feed, skipping FastAPI's response-model re-validation.
+    body = _POST_DETAILS.dump_json(
+        _POST_DETAILS.validate_python(post, from_attributes=True)
+    )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
 
 
 ## ----------------------------------------
@@ -168,39 +461,57 @@ async def toggle_like(
     """
     Toggle like. Prevents users from liking their own posts.
     """
-    # Check post exists
-    post = (
-        await session.execute(select(Post).where(Post.id == post_id))
-    ).scalar_one_or_none()
-
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-
-    # 👇 FIX: Prevent self-liking
-    if post.owner_id == user.id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You cannot like your own post.",
-        )
-
-    # Check if already liked
-    existing = (
+    # Unlike first: one conditional DELETE settles the common "already
+    # liked" case in a single round-trip (no existence pre-read).
+    unliked = (
         await session.execute(
-            select(Like).where(and_(Like.post_id == post_id, Like.user_id == user.id))
+            delete(Like)
+            .where(Like.post_id == post_id, Like.user_id == user.id)
+            .returning(Like.post_id)
         )
-    ).scalar_one_or_none()
-
-    if existing:
-        # Unlike
-        await session.delete(existing)
+    ).first()
+    if unliked:
         await session.commit()
+        invalidate_feed()
         return {"status": "unliked"}
 
-    # Like
-    new_like = Like(post_id=post_id, user_id=user.id)
-    session.add(new_like)
-    await session.commit()
-    return {"status": "liked"}
+    # Like: INSERT ... FROM SELECT enforces "post exists AND isn't mine"
+    # inside the same statement, so the happy path is one more round-trip
+    # instead of probe + existence check + insert. Two concurrent likes
+    # can both pass the DELETE above and race this insert — the loser's
+    # unique violation just means the like already landed.
+    try:
+        liked = (
+            await session.execute(
+                insert(Like)
+                .from_select(
+                    ["user_id", "post_id"],
+                    select(User.id, Post.id).where(
+                        User.id == user.id,
+                        Post.id == post_id,
+                        Post.owner_id != user.id,
+                    ),
+                )
+                .returning(Like.post_id)
+            )
+        ).first()
+    except IntegrityError:
+        await session.rollback()
+        return {"status": "liked"}
+    if liked:
+        await session.commit()
+        invalidate_feed()
+        return {"status": "liked"}
+
+    # Nothing inserted — only the error path pays to pick 404 vs 400.
+    await session.rollback()
+    owner_id = await session.scalar(_POST_OWNER_STMT, {"pid": post_id})
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="You cannot like your own post.",
+    )
 
 
 # ----------------------------------------
@@ -210,37 +521,45 @@ async def toggle_like(
 async def update_post(
     post_id: int,
     post_update: PostUpdate,
+    background_tasks: BackgroundTasks,
     user: User = Depends(current_active_verified_user),
     session: AsyncSession = Depends(get_db_session),
 ):
-    result = await session.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
+    update_data = post_update.model_dump(exclude_unset=True)
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Nothing to update"
+        )
 
-    if not post:
-        raise HTTPException(404, "Post not found")
+    # Fetch the old image URL only when the update replaces it
+    old_image_url = None
+    if "image_url" in update_data:
+        old_image_url = await session.scalar(_POST_IMAGE_STMT, {"pid": post_id})
+
+    # Ownership check and mutation in ONE conditional UPDATE instead of
+    # SELECT + hydrate + UPDATE. rowcount 0 means "missing or not owner".
+    stmt = (
+        update(Post)
+        .where(Post.id == post_id, Post.owner_id == user.id)
+        .values(**update_data)
+        .returning(Post)
+    )
+    post = (await session.execute(stmt)).scalar_one_or_none()
 
-    if post.owner_id != user.id:
+    if post is None:
+        # Only the error path pays for a second query to pick 404 vs 403
+        owner_id = await session.scalar(_POST_OWNER_STMT, {"pid": post_id})
+        if owner_id is None:
+            raise HTTPException(404, "Post not found")
         raise HTTPException(403, "Not authorized")
 
-    update_data = post_update.model_dump(exclude_unset=True)
-    old_image_url = post.image_url if "image_url" in update_data else None
-
-    for key, value in update_data.items():
-        setattr(post, key, value)
-
-    session.add(post)
     await session.commit()
-    await session.refresh(post)
+    invalidate_feed()
 
     if old_image_url and old_image_url != post.image_url:
-        try:
-            filename = os.path.basename(old_image_url)
-            file_path = os.path.join(STATIC_DIR, filename)
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"Deleted old image file {filename}")
-        except Exception as e:
-            logger.error(f"Failed to delete old image: {e}")
+        # Cleanup runs in the threadpool AFTER the response is sent —
+        # the client never waits on disk I/O.
+        background_tasks.add_task(_cleanup_image, old_image_url)
 
     return post
 
@@ -251,32 +570,31 @@ async def update_post(
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: int,
+    background_tasks: BackgroundTasks,
     user: User = Depends(current_active_verified_user),
     session: AsyncSession = Depends(get_db_session),
 ):
-    result = await session.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
-
-    if not post:
-        raise HTTPException(404, "Post not found")
+    # One conditional DELETE — comments and likes cascade in the database,
+    # so no ORM load of the post (or its collections) is needed.
+    stmt = (
+        delete(Post)
+        .where(Post.id == post_id, Post.owner_id == user.id)
+        .returning(Post.image_url)
+    )
+    row = (await session.execute(stmt)).first()
 
-    if post.owner_id != user.id:
+    if row is None:
+        owner_id = await session.scalar(_POST_OWNER_STMT, {"pid": post_id})
+        if owner_id is None:
+            raise HTTPException(404, "Post not found")
         raise HTTPException(403, "Not authorized")
 
-    image_url = post.image_url
-
-    await session.delete(post)
+    image_url = row.image_url
     await session.commit()
+    invalidate_feed()
 
     if image_url:
-        try:
-            filename = os.path.basename(image_url)
-            path = os.path.join(STATIC_DIR, filename)
-            if os.path.exists(path):
-                os.remove(path)
-                logger.info(f"Deleted image {filename}")
-        except Exception as e:
-            logger.error(f"Failed to delete image: {e}")
+        background_tasks.add_task(_cleanup_image, image_url)
 
     return None
 
@@ -287,21 +605,56 @@ async def delete_post(
 @router.get("/{post_id}/comments/", response_model=List[CommentReadWithUser])
 async def get_comments_for_post(
     post_id: int,
+    request: Request,
     session: AsyncSession = Depends(get_db_session),
+    after: Optional[datetime] = None,
+    limit: int = 50,
 ):
-    post_exists = (
-        await session.execute(select(Post).where(Post.id == post_id))
-    ).scalar_one_or_none()
-    if not post_exists:
+    # Existence check and ETag freshness probe in one round-trip: the row
+    # only comes back if the post exists, carrying the comment aggregates.
+    meta = (
+        await session.execute(
+            select(
+                select(func.count())
+                .select_from(Comment)
+                .where(Comment.post_id == post_id)
+                .scalar_subquery()
+                .label("total"),
+                select(func.max(Comment.updated_at))
+                .where(Comment.post_id == post_id)
+                .scalar_subquery()
+                .label("max_updated"),
+            )
+            .select_from(Post)
+            .where(Post.id == post_id)
+        )
+    ).first()
+    if meta is None:
         raise HTTPException(404, "Post not found")
 
-    result = await session.execute(
-        select(Comment)
-        .where(Comment.post_id == post_id)
-        .options(selectinload(Comment.owner))
-        .order_by(Comment.created_at.asc())
+    etag = _weak_etag(post_id, meta.total, meta.max_updated, after, limit)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        # Unchanged — skip the comment fetch and serialization entirely
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Keyset page: ?after=<last created_at> seeks on the composite index
+    # instead of re-reading the whole thread. Response stays a plain list
+    # (clients take the last element's created_at as the next cursor).
+    if after is not None:
+        stmt, params = _COMMENTS_PAGE_AFTER_STMT, {
+            "pid": post_id,
+            "lim": limit,
+            "after": after,
+        }
+    else:
+        stmt, params = _COMMENTS_PAGE_STMT, {"pid": post_id, "lim": limit}
+    result = await session.execute(stmt, params)
+    comments = result.scalars().all()
+    body = _COMMENT_LIST.dump_json(
+        _COMMENT_LIST.validate_python(comments, from_attributes=True)
     )
-    return result.scalars().all()
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # ----------------------------------------
@@ -318,21 +671,25 @@ async def create_comment_for_post(
     user: User = Depends(current_active_verified_user),
     session: AsyncSession = Depends(get_db_session),
 ):
-    post_exists = (
-        await session.execute(select(Post).where(Post.id == post_id))
-    ).scalar_one_or_none()
-
-    if not post_exists:
-        raise HTTPException(404, "Post not found")
-
-    new_comment = Comment(**comment.model_dump(), owner_id=user.id, post_id=post_id)
-    session.add(new_comment)
-    await session.commit()
-    await session.refresh(new_comment)
-
-    result = await session.execute(
-        select(Comment)
-        .where(Comment.id == new_comment.id)
-        .options(selectinload(Comment.owner))
+    # No existence pre-check: the FK on comments.post_id already rejects a
+    # bad post_id, so the happy path is ONE INSERT ... RETURNING round-trip
+    # (server defaults come back with the insert, no refresh needed).
+    stmt = (
+        insert(Comment)
+        .values(**comment.model_dump(), owner_id=user.id, post_id=post_id)
+        .returning(Comment)
     )
-    return result.scalar_one()
+    try:
+        new_comment = (await session.execute(stmt)).scalar_one()
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if "post_id" in str(e.orig) or "foreign key" in str(e.orig).lower():
+            raise HTTPException(404, "Post not found")
+        raise
+
+    # The authenticated user IS the owner — attach it in-memory instead of
+    # re-selecting the comment with selectinload (a whole extra round-trip).
+    # set_committed_value skips change events, so no dirty flag or cascade.
+    set_committed_value(new_comment, "owner", user)
+    return new_comment
@@ -0,0 +1,54 @@
+# app/rate_limit.py
+from fastapi import Request, Response
+from fastapi_limiter import FastAPILimiter
+from fastapi_limiter.depends import RateLimiter
+
+from .logging_config import logger
+
+
+async def auth_identifier(request: Request) -> str:
+    """
+    Rate-limit key: client IP + submitted username (when there is a form).
+
+    Including the username means one abusive IP can't lock out other
+    accounts, and one account can't be brute-forced from many IPs.
+    """
+    ip = request.client.host if request.client else "unknown"
+
+    username = ""
+    if request.method == "POST":
+        try:
+            # Starlette caches the parsed form, so the endpoint's own
+            # OAuth2PasswordRequestForm dependency does not re-read the body.
+            form = await request.form()
+            username = str(form.get("username", ""))
+        except Exception:
+            pass
+
+    return f"{ip}:{username}" if username else ip
+
+
+class OptionalRateLimiter(RateLimiter):
+    """
+    RateLimiter that silently no-ops when Redis is not configured,
+    so local development without Redis keeps working.
+    """
+
+    _warned = False
+
+    async def __call__(self, request: Request, response: Response):
+        if not FastAPILimiter.redis:
+            if not OptionalRateLimiter._warned:
+                logger.warning(
+                    "⚠️ Rate limiting disabled: REDIS_URL not configured."
+                )
+                OptionalRateLimiter._warned = True
+            return
+        return await super().__call__(request, response)
+
+
+# 5 attempts per minute per (IP, username) on the expensive auth endpoints.
+# This rejects brute-force traffic with one O(1) Redis round-trip BEFORE
+# the argon2 verify / JWT sign / DB lookup ever runs.
+login_rate_limiter = OptionalRateLimiter(times=5, seconds=60)
+refresh_rate_limiter = OptionalRateLimiter(times=30, seconds=60)
@@ -91,6 +91,8 @@ class PostRead(PostBase):
 
 
 # The Detailed Schema used for Single Post View (includes comments & owner)
+# NOTE: comments holds only the first page (POST_DETAIL_COMMENTS in
+# posts.py); the full thread is paged via GET /posts/{id}/comments/.
 class PostReadWithDetails(PostRead):
     owner: UserRead
     comments: List[CommentReadWithUser] = Field(default_factory=list)
@@ -102,3 +104,5 @@ class PostReadWithDetails(PostRead):
 class PaginatedPostResponse(BaseModel):
     total: int
     posts: List[PostRead]
+    # Opaque keyset cursor for the next page; None on the last page.
+    next_cursor: Optional[str] = None
@@ -2,4 +2,14 @@
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.app:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop + httptools ship with uvicorn[standard]; pin them explicitly
+    # so the C event loop and HTTP parser are always the ones running.
+    uvicorn.run(
+        "app.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=30,
+    )